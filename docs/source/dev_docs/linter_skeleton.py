@@ -12,15 +12,15 @@ class XYQueryStringLinter(QueryStringLinter):
     """Linter for XY query strings"""
 
     VALID_TOKEN_SEQUENCES = {
-        TokenTypes.FIELD: [TokenTypes.TERM],
-        TokenTypes.TERM: [
+        TokenTypes.FIELD: {TokenTypes.TERM},
+        TokenTypes.TERM: {
             TokenTypes.LOGIC_OPERATOR,
             TokenTypes.PARENTHESIS_CLOSED,
-        ],
-        TokenTypes.LOGIC_OPERATOR: [
+        },
+        TokenTypes.LOGIC_OPERATOR: {
             TokenTypes.TERM,
             TokenTypes.PARENTHESIS_OPEN,
-        ],
+        },
         # ...
     }
 
@@ -48,7 +48,7 @@ class XYQueryStringLinter(QueryStringLinter):
 
     def check_invalid_token_sequences(self) -> None:
         for i, token in enumerate(self.parser.tokens[:-1]):
-            expected = self.VALID_TOKEN_SEQUENCES.get(token.type, [])
+            expected = self.VALID_TOKEN_SEQUENCES.get(token.type, set())
             if self.parser.tokens[i + 1].type not in expected:
                 self.add_message(
                     QueryErrorCode.INVALID_TOKEN_SEQUENCE,
@@ -177,6 +177,22 @@ class Fields:
         ]
 
 
+def build_reverse_field_map(syntax_generic_map: dict) -> typing.Dict[str, str]:
+    """Build the reverse lookup (generic field -> syntax string)
+    of a SYNTAX_GENERIC_MAP.
+
+    The first matching key wins, and keys that map to exactly one generic field
+    take precedence over keys that map to a combination of fields."""
+    reverse_map = {}
+    for syntax_str, generic_fields in reversed(syntax_generic_map.items()):
+        for generic_field in generic_fields:
+            reverse_map[generic_field] = syntax_str
+    for syntax_str, generic_fields in reversed(syntax_generic_map.items()):
+        if len(generic_fields) == 1:
+            reverse_map[next(iter(generic_fields))] = syntax_str
+    return reverse_map
+
+
 class ExitCodes:
     """Exit codes"""
 
@@ -4,6 +4,7 @@
 import re
 from copy import deepcopy
 
+from search_query.constants import build_reverse_field_map
 from search_query.constants import Fields
 
 
@@ -30,6 +31,8 @@ SYNTAX_GENERIC_MAP = {
     "PT": {Fields.PUBLICATION_TYPE},
 }
 
+_GENERIC_SYNTAX_MAP = build_reverse_field_map(SYNTAX_GENERIC_MAP)
+
 _RAW_PREPROCESSING_MAP = {
     "TI": r"TI",
     "AB": r"AB",
@@ -59,7 +62,7 @@ VALID_fieldS_REGEX = re.compile(
 def map_to_standard(syntax_str: str) -> str:
     """Map a syntax string to a standard syntax string."""
     for standard_key, variation_regex in PREPROCESSING_MAP.items():
-        if re.match(variation_regex, syntax_str):
+        if variation_regex.match(syntax_str):
             return standard_key
     raise ValueError
 
@@ -71,9 +74,8 @@ def syntax_str_to_generic_field_set(field_value: str) -> set:
     field_value = map_to_standard(field_value)
 
     # Convert search fields to default field constants
-    for key, value in SYNTAX_GENERIC_MAP.items():
-        if field_value == key:
-            return deepcopy(value)
+    if field_value in SYNTAX_GENERIC_MAP:
+        return deepcopy(SYNTAX_GENERIC_MAP[field_value])
 
     raise ValueError(f"Field {field_value} not supported by EBSCO")  # pragma: no cover
 
@@ -81,13 +83,8 @@ def syntax_str_to_generic_field_set(field_value: str) -> set:
 def generic_field_to_syntax_field(generic_field: str) -> str:
     """Convert a set of generic search fields to a set of syntax strings."""
 
-    for key, value in SYNTAX_GENERIC_MAP.items():
-        if {generic_field} == value:
-            return key
-
-    for key, value in SYNTAX_GENERIC_MAP.items():
-        if {generic_field} & value:
-            return key
+    if generic_field in _GENERIC_SYNTAX_MAP:
+        return _GENERIC_SYNTAX_MAP[generic_field]
 
     raise ValueError(  # pragma: no cover
         f"Generic search field set {generic_field} not supported by EBSCO"
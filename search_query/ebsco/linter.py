@@ -16,7 +16,6 @@ from search_query.linter_base import QueryStringLinter
 
 if typing.TYPE_CHECKING:  # pragma: no cover
     from search_query.query import Query
-    from search_query.parser_base import QueryStringParser
 
     from search_query.ebsco.parser import EBSCOListParser
 
@@ -24,41 +23,48 @@ if typing.TYPE_CHECKING:  # pragma: no cover
 class EBSCOQueryStringLinter(QueryStringLinter):
     """Linter for EBSCO Query Strings"""
 
-    UNSUPPORTED_FIELD_REGEX = r"\b(?!OR\b)\b(?!S\d+\b)[A-Z]{2}\b"
+    INVALID_FIELD_SYNTAX_REGEX = re.compile(r"\[[A-Za-z]*\]")
+    PROXIMITY_DISTANCE_REGEX = re.compile(r"/(\d+)")
+    LOWER_CASE_FIELD_REGEX = re.compile(r"^[a-z]{2}$")
+    LEADING_WILDCARD_REGEX = re.compile(r"^(\*|\?|\#)")
+    SECOND_POSITION_WILDCARD_REGEX = re.compile(r"^[^\*\?\#](\?|\#)")
+    SECOND_POSITION_STAR_REGEX = re.compile(r"^[^\*\?\#](\*)")
+    # Fields that are matched exactly (not considered for redundancy checks)
+    EXACT_FIELDS_REGEX = re.compile(r"^(ZY)$")
 
     PLATFORM: PLATFORM = PLATFORM.EBSCO
     VALID_fieldS_REGEX = VALID_fieldS_REGEX
 
     VALID_TOKEN_SEQUENCES = {
-        TokenTypes.FIELD: [
+        TokenTypes.FIELD: {
             TokenTypes.TERM,
             TokenTypes.PARENTHESIS_OPEN,
-        ],
-        TokenTypes.TERM: [
+        },
+        TokenTypes.TERM: {
             TokenTypes.LOGIC_OPERATOR,
             TokenTypes.PROXIMITY_OPERATOR,
             TokenTypes.PARENTHESIS_CLOSED,
-        ],
-        TokenTypes.LOGIC_OPERATOR: [
+        },
+        TokenTypes.LOGIC_OPERATOR: {
             TokenTypes.TERM,
             TokenTypes.FIELD,
             TokenTypes.PARENTHESIS_OPEN,
-        ],
-        TokenTypes.PROXIMITY_OPERATOR: [
+        },
+        TokenTypes.PROXIMITY_OPERATOR: {
             TokenTypes.TERM,
             TokenTypes.PARENTHESIS_OPEN,
             TokenTypes.FIELD,
-        ],
-        TokenTypes.PARENTHESIS_OPEN: [
+        },
+        TokenTypes.PARENTHESIS_OPEN: {
             TokenTypes.FIELD,
             TokenTypes.TERM,
             TokenTypes.PARENTHESIS_OPEN,
-        ],
-        TokenTypes.PARENTHESIS_CLOSED: [
+        },
+        TokenTypes.PARENTHESIS_CLOSED: {
             TokenTypes.PARENTHESIS_CLOSED,
             TokenTypes.LOGIC_OPERATOR,
             TokenTypes.PROXIMITY_OPERATOR,
-        ],
+        },
     }
 
     def __init__(
@@ -118,7 +124,7 @@ class EBSCOQueryStringLinter(QueryStringLinter):
         """Check for invalid syntax in the query string."""
 
         # Check for erroneous field syntax
-        match = re.search(r"\[[A-Za-z]*\]", self.query_str)
+        match = self.INVALID_FIELD_SYNTAX_REGEX.search(self.query_str)
         if match:
             self.add_message(
                 QueryErrorCode.INVALID_SYNTAX,
@@ -138,7 +144,7 @@ class EBSCOQueryStringLinter(QueryStringLinter):
         for token in self.tokens:
             if token.type == TokenTypes.PROXIMITY_OPERATOR:
                 digit = "x"
-                m = re.search(r"/(\d+)", token.value)
+                m = self.PROXIMITY_DISTANCE_REGEX.search(token.value)
                 if m:
                     digit = m.group(1)
 
@@ -184,74 +190,66 @@ class EBSCOQueryStringLinter(QueryStringLinter):
                 fatal=True,
             )
 
-        i = -1
-        while i < len(self.tokens) - 1:
-            i += 1
-            if i == 0:
-                continue
-
+        # Check following token sequences
+        for i in range(1, len(self.tokens)):
             token = self.tokens[i]
             token_type = token.type
             prev_type = self.tokens[i - 1].type
 
-            token_type = token.type
-            prev_type = self.tokens[i - 1].type
+            if token_type in self.VALID_TOKEN_SEQUENCES[prev_type]:
+                continue
 
-            if token_type not in self.VALID_TOKEN_SEQUENCES[prev_type]:
-                details = ""
+            details = ""
+            positions = [token.position if token_type else self.tokens[i - 1].position]
+            if token_type == TokenTypes.FIELD:
+                details = "Invalid search field position"
+                positions = [token.position]
+
+            elif token_type == TokenTypes.LOGIC_OPERATOR:
+                details = "Invalid operator position"
+                if prev_type == TokenTypes.LOGIC_OPERATOR:
+                    details = "Cannot have two consecutive operators"
+                positions = [(self.tokens[i - 1].position[0], token.position[1])]
+
+            elif (
+                prev_type == TokenTypes.PARENTHESIS_OPEN
+                and token_type == TokenTypes.PARENTHESIS_CLOSED
+            ):
+                details = "Empty parenthesis"
                 positions = [
-                    (token.position if token_type else self.tokens[i - 1].position)
-                ]
-                if token_type == TokenTypes.FIELD:
-                    details = "Invalid search field position"
-                    positions = [token.position]
-
-                elif token_type == TokenTypes.LOGIC_OPERATOR:
-                    details = "Invalid operator position"
-                    if prev_type == TokenTypes.LOGIC_OPERATOR:
-                        details = "Cannot have two consecutive operators"
-                    positions = [(self.tokens[i - 1].position[0], token.position[1])]
-
-                elif (
-                    prev_type == TokenTypes.PARENTHESIS_OPEN
-                    and token_type == TokenTypes.PARENTHESIS_CLOSED
-                ):
-                    details = "Empty parenthesis"
-                    positions = [
-                        (
-                            self.tokens[i - 1].position[0],
-                            token.position[1],
-                        )
-                    ]
-                elif token_type == TokenTypes.PARENTHESIS_OPEN and re.match(
-                    r"^[a-z]{2}$", self.tokens[i - 1].value
-                ):
-                    details = "Search field is not supported (must be upper case)"
-                    positions = [self.tokens[i - 1].position]
-                    self.add_message(
-                        QueryErrorCode.FIELD_UNSUPPORTED,
-                        positions=positions,
-                        details=details,
-                        fatal=True,
+                    (
+                        self.tokens[i - 1].position[0],
+                        token.position[1],
                     )
-                    continue
-                elif (
-                    token_type and prev_type and prev_type != TokenTypes.LOGIC_OPERATOR
-                ):
-                    details = "Missing operator between terms"
-                    positions = [
-                        (
-                            self.tokens[i - 1].position[0],
-                            token.position[1],
-                        )
-                    ]
-
+                ]
+            elif (
+                token_type == TokenTypes.PARENTHESIS_OPEN
+                and self.LOWER_CASE_FIELD_REGEX.match(self.tokens[i - 1].value)
+            ):
+                details = "Search field is not supported (must be upper case)"
+                positions = [self.tokens[i - 1].position]
                 self.add_message(
-                    QueryErrorCode.INVALID_TOKEN_SEQUENCE,
+                    QueryErrorCode.FIELD_UNSUPPORTED,
                     positions=positions,
                     details=details,
                     fatal=True,
                 )
+                continue
+            elif token_type and prev_type and prev_type != TokenTypes.LOGIC_OPERATOR:
+                details = "Missing operator between terms"
+                positions = [
+                    (
+                        self.tokens[i - 1].position[0],
+                        token.position[1],
+                    )
+                ]
+
+            self.add_message(
+                QueryErrorCode.INVALID_TOKEN_SEQUENCE,
+                positions=positions,
+                details=details,
+                fatal=True,
+            )
 
         # Check the last token
         if self.tokens[-1].type in [
@@ -272,7 +270,7 @@ class EBSCOQueryStringLinter(QueryStringLinter):
         if query.is_term():
             val = query.value
             # Check for leading wildcard
-            match = re.search(r"^(\*|\?|\#)", val)
+            match = self.LEADING_WILDCARD_REGEX.search(val)
             if match:
                 position = (-1, -1)
                 if query.position:
@@ -289,7 +287,7 @@ class EBSCOQueryStringLinter(QueryStringLinter):
 
             # Count each wildcard
             char_count = sum(c not in "*?#" for c in val[:4])
-            if re.search(r"^[^\*\?\#](\?|\#)", val) and char_count < 2:
+            if self.SECOND_POSITION_WILDCARD_REGEX.search(val) and char_count < 2:
                 # Star in second position followed by more letters (e.g., "f*tal")
                 position = (-1, -1)
                 if query.position:
@@ -307,7 +305,7 @@ class EBSCOQueryStringLinter(QueryStringLinter):
                     fatal=True,
                 )
 
-            if re.search(r"^[^\*\?\#](\*)", val):
+            if self.SECOND_POSITION_STAR_REGEX.search(val):
                 position = (-1, -1)
                 if query.position:
                     position = (query.position[0], query.position[0] + len(val))
@@ -343,7 +341,7 @@ class EBSCOQueryStringLinter(QueryStringLinter):
         self._check_journal_filters_in_subquery(term_field_query)
         self._check_for_wildcard_usage(term_field_query)
         self._check_redundant_terms(
-            term_field_query, exact_fields=re.compile(r"^(ZY)$")
+            term_field_query, exact_fields=self.EXACT_FIELDS_REGEX
         )
         # Exception for ZY:
         # ZY "south sudan" AND TI "context of vegetarians"
@@ -359,14 +357,7 @@ class EBSCOQueryStringLinter(QueryStringLinter):
 class EBSCOListLinter(QueryListLinter):
     """Linter for PubMed Query Strings"""
 
-    def __init__(
-        self,
-        parser: EBSCOListParser,
-        string_parser_class: typing.Type[QueryStringParser],
-    ):
-        self.parser: EBSCOListParser = parser
-        self.string_parser_class = string_parser_class
-        super().__init__(parser, string_parser_class)
+    parser: EBSCOListParser
 
     def validate_tokens(self) -> None:
         """Validate token list"""
@@ -29,6 +29,11 @@ class EBSCOParser(QueryStringParser):
     )
     FIELD_REGEX = re.compile(r"\b([A-Z]{2})\b")
     TERM_REGEX = re.compile(r"\"[^\"]*\"|\*?\b[^()\s]+")
+    POTENTIAL_TERM_REGEX = re.compile(r"[A-Z]{2,}")
+    PREFIX_REGEX = re.compile(
+        r"^EBSCOHost.*\:\s*|PsycInfo|ERIC|CINAHL with Full Text",
+        flags=re.IGNORECASE,
+    )
 
     OPERATOR_REGEX = re.compile(
         "|".join([LOGIC_OPERATOR_REGEX.pattern, PROXIMITY_OPERATOR_REGEX.pattern])
@@ -135,7 +140,7 @@ class EBSCOParser(QueryStringParser):
         """Fix ambiguous tokens that could be misinterpreted as a search field."""
 
         def is_potential_term(token_str: str) -> bool:
-            return bool(re.fullmatch(r"[A-Z]{2,}", token_str))
+            return bool(self.POTENTIAL_TERM_REGEX.fullmatch(token_str))
 
         # Field token followed by term which is misclassified as a field token
         for i in range(len(self.tokens) - 1):
@@ -388,13 +393,7 @@ class EBSCOParser(QueryStringParser):
         self.linter.handle_fully_quoted_query_str(self)
         self.linter.handle_nonstandard_quotes_in_query_str(self)
         self.linter.handle_suffix_in_query_str(self)
-        self.linter.handle_prefix_in_query_str(
-            self,
-            prefix_regex=re.compile(
-                r"^EBSCOHost.*\:\s*|PsycInfo|ERIC|CINAHL with Full Text",
-                flags=re.IGNORECASE,
-            ),
-        )
+        self.linter.handle_prefix_in_query_str(self, prefix_regex=self.PREFIX_REGEX)
 
     def parse(self) -> Query:
         """Parse a query string."""
@@ -8,25 +8,32 @@ if typing.TYPE_CHECKING:  # pragma: no cover
     from search_query.query import Query
 
 
-def to_string_generic(query: Query) -> str:
-    """Convert the query to a string."""
+def _append_generic(query: Query, parts: typing.List[str]) -> None:
+    """Append the generic string of the query (and its children) to parts."""
     if not hasattr(query, "value"):  # pragma: no cover
-        return " (?) "
+        parts.append(" (?) ")
+        return
 
-    result = ""
     query_content = query.value
     if hasattr(query, "distance"):  # and isinstance(query.distance, int):
         query_content += f"/{query.distance}"
     if query.field:
         query_content += f"[{query.field}]"
 
-    result = f"{result}{query_content}"
+    parts.append(query_content)
     if query.children == []:
-        return result
-
-    result = f"{result}["
-    for child in query.children:
-        result = f"{result}{to_string_generic(child)}"
-        if child != query.children[-1]:
-            result = f"{result}, "
-    return f"{result}]"
+        return
+
+    parts.append("[")
+    for i, child in enumerate(query.children):
+        if i > 0:
+            parts.append(", ")
+        _append_generic(child, parts)
+    parts.append("]")
+
+
+def to_string_generic(query: Query) -> str:
+    """Convert the query to a string."""
+    parts: typing.List[str] = []
+    _append_generic(query, parts)
+    return "".join(parts)
@@ -8,6 +8,7 @@ import sys
 import textwrap
 import typing
 from abc import abstractmethod
+from collections import Counter
 from collections import defaultdict
 
 import search_query.parser_base
@@ -37,8 +38,13 @@ if typing.TYPE_CHECKING:  # pragma: no cover
 class QueryStringLinter:
     """Class for Query String Validation"""
 
-    FAULTY_OPERATOR_REGEX = r"\b(?:[aA][nN][dD]|[oO][rR]|[nN][oO][tT])\b"
-    PARENTHESIS_REGEX = r"[\(\)]"
+    NEAR_DISTANCE_REGEX = re.compile(r"\d{1,2}")
+    UNSUPPORTED_SUFFIX_REGEX = re.compile(r"\)(?!\s*(AND|OR|NOT))[^()\[\]]*$")
+    NON_STANDARD_QUOTES = "“”«»„‟"
+    NON_STANDARD_QUOTES_REGEX = re.compile(f"[{NON_STANDARD_QUOTES}]")
+    NON_STANDARD_QUOTES_TABLE = str.maketrans(
+        NON_STANDARD_QUOTES, '"' * len(NON_STANDARD_QUOTES)
+    )
 
     # Higher number=higher precedence
     OPERATOR_PRECEDENCE = {
@@ -61,11 +67,10 @@ class QueryStringLinter:
         self.tokens: typing.List[Token] = []
 
         self.query_str = query_str
-        # Note: original, unchanged query string
-        self._original_query_str = query_str
         self.field_general = ""
-        self.query: typing.Optional[Query] = None
         self.messages: typing.List[dict] = []
+        # (code, positions) of the messages added so far (for deduplication)
+        self._message_keys: typing.Set[tuple] = set()
         self.last_read_index = 0
         # original_str: to preserve the original query string
         # for error messages, if it is different from query_str
@@ -83,11 +88,10 @@ class QueryStringLinter:
     ) -> None:
         """Add a linter message."""
         # do not add duplicates
-        if any(
-            error.code == msg["code"] and positions == msg["position"]
-            for msg in self.messages
-        ):
+        key = (error.code, None if positions is None else tuple(positions))
+        if key in self._message_keys:
             return
+        self._message_keys.add(key)
 
         self.messages.append(
             {
@@ -272,12 +276,14 @@ class QueryStringLinter:
 
     def check_unbalanced_parentheses(self) -> None:
         """Check query for unbalanced parentheses."""
-        i = 0
+        # Single pass: opening parentheses that are still open at the end
+        # of the query are unbalanced
+        open_parentheses: typing.List[Token] = []
         for token in self.tokens:
             if token.type == TokenTypes.PARENTHESIS_OPEN:
-                i += 1
+                open_parentheses.append(token)
             if token.type == TokenTypes.PARENTHESIS_CLOSED:
-                if i == 0:
+                if not open_parentheses:
                     self.add_message(
                         QueryErrorCode.UNBALANCED_PARENTHESES,
                         positions=[token.position],
@@ -285,23 +291,15 @@ class QueryStringLinter:
                         fatal=True,
                     )
                 else:
-                    i -= 1
-        if i > 0:
-            # Query contains unbalanced opening parentheses
-            i = 0
-            for token in reversed(self.tokens):
-                if token.type == TokenTypes.PARENTHESIS_CLOSED:
-                    i += 1
-                if token.type == TokenTypes.PARENTHESIS_OPEN:
-                    if i == 0:
-                        self.add_message(
-                            QueryErrorCode.UNBALANCED_PARENTHESES,
-                            positions=[token.position],
-                            details="Unbalanced opening parenthesis",
-                            fatal=True,
-                        )
-                    else:
-                        i -= 1
+                    open_parentheses.pop()
+        # Report unbalanced opening parentheses from the end of the query
+        for token in reversed(open_parentheses):
+            self.add_message(
+                QueryErrorCode.UNBALANCED_PARENTHESES,
+                positions=[token.position],
+                details="Unbalanced opening parenthesis",
+                fatal=True,
+            )
 
     def check_unbalanced_quotes_in_terms(self, query: Query) -> None:
         """Recursively check for unbalanced quotes in quoted search terms."""
@@ -395,7 +393,7 @@ class QueryStringLinter:
         for token in self.tokens:
             if token.type != TokenTypes.PROXIMITY_OPERATOR:
                 continue
-            near_distance = re.findall(r"\d{1,2}", token.value)
+            near_distance = self.NEAR_DISTANCE_REGEX.findall(token.value)
             if near_distance and int(near_distance[0]) > max_value:
                 self.add_message(
                     QueryErrorCode.NEAR_DISTANCE_TOO_LARGE,
@@ -436,7 +434,7 @@ class QueryStringLinter:
         if quote_count % 2 != 0:
             return  # unbalanced quotes, do not attempt trimming
 
-        suffix_match = re.search(r"\)(?!\s*(AND|OR|NOT))[^()\[\]]*$", parser.query_str)
+        suffix_match = self.UNSUPPORTED_SUFFIX_REGEX.search(parser.query_str)
 
         original_query_str = parser.query_str  # preserve for position calculation
 
@@ -464,22 +462,17 @@ class QueryStringLinter:
         if not ('"' == parser.query_str[0] and '"' == parser.query_str[-1]):
             return
 
-        # iterate over chars from left to right
-        for char in parser.query_str[1:]:
-            if char == '"':
-                # if we find a quote, we can stop
-                return
-            if char == "(":
-                # if we find an opening parenthesis, we can stop
-                break
-        # iterate in reverse
-        for char in reversed(parser.query_str[:-1]):
-            if char == '"':
-                # if we find a quote, we can stop
-                return
-            if char == ")":
-                # if we find a closing parenthesis, we can stop
-                break
+        # from left to right: stop if a quote precedes the first opening parenthesis
+        quote_pos = parser.query_str.find('"', 1)
+        parenthesis_pos = parser.query_str.find("(", 1)
+        if quote_pos != -1 and (parenthesis_pos == -1 or quote_pos < parenthesis_pos):
+            return
+        # in reverse: stop if a quote follows the last closing parenthesis
+        end = len(parser.query_str) - 1
+        quote_pos = parser.query_str.rfind('"', 0, end)
+        parenthesis_pos = parser.query_str.rfind(")", 0, end)
+        if quote_pos > parenthesis_pos:
+            return
 
         if "(" in parser.query_str:
             self.add_message(
@@ -537,26 +530,27 @@ class QueryStringLinter:
     def handle_nonstandard_quotes_in_query_str(self, parser: QueryStringParser) -> None:
         """Handle non-standard quotes in query string."""
 
-        non_standard_quotes = "“”«»„‟"
-        positions = []
-        found_quotes = []
-        for quote in non_standard_quotes:
-            quote_positions = [
-                (i, i + 1) for i, c in enumerate(parser.query_str) if c == quote
-            ]
-            if not quote_positions:
-                continue
-            positions.extend(quote_positions)
-            found_quotes.append(quote)
-            # Replace all occurrences of this quote with standard quote
-            parser.query_str = parser.query_str.replace(quote, '"')
-            self.query_str = self.query_str.replace(quote, '"')
-        if positions:
-            self.add_message(
-                QueryErrorCode.NON_STANDARD_QUOTES,
-                positions=positions,
-                details=f"Non-standard quotes found: {''.join(sorted(found_quotes))}",
-            )
+        # Collect positions in a single scan, grouped by quote character
+        positions_by_quote: typing.Dict[str, typing.List[typing.Tuple[int, int]]] = {}
+        for match in self.NON_STANDARD_QUOTES_REGEX.finditer(parser.query_str):
+            positions_by_quote.setdefault(match.group(), []).append(match.span())
+        if not positions_by_quote:
+            return
+
+        # Replace all non-standard quotes with standard quotes (in one pass)
+        parser.query_str = parser.query_str.translate(self.NON_STANDARD_QUOTES_TABLE)
+        self.query_str = self.query_str.translate(self.NON_STANDARD_QUOTES_TABLE)
+
+        positions = [
+            position
+            for quote in self.NON_STANDARD_QUOTES
+            for position in positions_by_quote.get(quote, [])
+        ]
+        self.add_message(
+            QueryErrorCode.NON_STANDARD_QUOTES,
+            positions=positions,
+            details=f"Non-standard quotes found: {''.join(sorted(positions_by_quote))}",
+        )
 
     def add_higher_value(
         self,
@@ -1185,14 +1179,14 @@ class QueryStringLinter:
 
     def _highlight_removed_chars(self, original: str, modified: str) -> str:
         diff = difflib.ndiff(original, modified)
-        result = ""
+        parts: typing.List[str] = []
         for d in diff:
             if d.startswith("-"):
-                result += f"{Colors.RED}{d[-1]}{Colors.END}"  # highlight removed chars
+                parts.append(f"{Colors.RED}{d[-1]}{Colors.END}")  # highlight removed
             elif d.startswith(" "):
-                result += d[-1]  # unchanged chars
+                parts.append(d[-1])  # unchanged chars
             # skip added characters ('+')
-        return result
+        return "".join(parts)
 
     # TODO : 10.1079_SEARCHRXIV.2023.00129.json , 10.1079_SEARCHRXIV.2023.00269.json ,
     # 10.1079_SEARCHRXIV.2024.00457.json- position mismtach
@@ -1273,13 +1267,13 @@ class QueryStringLinter:
             if operator == Operators.NOT:
                 terms.pop(0)  # First term of a NOT query cannot be redundant
 
-            redundant_terms = []
+            redundant_terms: typing.Set[Query] = set()
             for term_a in terms:
                 if not term_a.field:
                     continue
                 for term_b in terms:
                     if (
-                        term_a == term_b
+                        term_a is term_b
                         or term_a in redundant_terms
                         or term_b in redundant_terms
                     ):
@@ -1311,7 +1305,7 @@ class QueryStringLinter:
                                 positions=[term_a.position, term_b.position],
                                 details=details,
                             )
-                            redundant_terms.append(term_a)
+                            redundant_terms.add(term_a)
                             continue
                         # Terms in AND queries follow different redundancy logic
                         # than terms in OR queries
@@ -1331,7 +1325,7 @@ class QueryStringLinter:
                                 positions=[term_a.position, term_b.position],
                                 details=details,
                             )
-                            redundant_terms.append(term_a)
+                            redundant_terms.add(term_a)
                         elif operator == Operators.OR:
                             self.add_message(
                                 QueryErrorCode.REDUNDANT_TERM,
@@ -1343,7 +1337,7 @@ class QueryStringLinter:
                                 "As both terms are connected with OR, "
                                 f"the term {term_b.value} is redundant.",
                             )
-                            redundant_terms.append(term_b)
+                            redundant_terms.add(term_b)
 
     # 10.1079_SEARCHRXIV.2023.00269.json
     def _check_for_opportunities_to_combine_subqueries(
@@ -1421,8 +1415,9 @@ class QueryStringLinter:
                 for term in term_field_query.children
                 if term.is_term() and " " not in term.value
             ]
+            stemmed_counts = Counter(stemmed_all)
             stemmed_matching_multiple_terms = [
-                s for s in stemmed_all if stemmed_all.count(s) > 1
+                s for s in stemmed_all if stemmed_counts[s] > 1
             ]
             if len(stemmed_matching_multiple_terms) > 1:
                 # assign terms and stemmed
@@ -25,6 +25,7 @@ class QueryStringParser(ABC):
     # Note: override the following:
     OPERATOR_REGEX: re.Pattern = re.compile(r"^(AND|OR|NOT)$", flags=re.IGNORECASE)
     LOGIC_OPERATOR_REGEX = re.compile(r"\b(AND|OR|NOT)\b", flags=re.IGNORECASE)
+    APPENDED_OPERATOR_REGEX = re.compile(r"(AND|OR|NOT)$")
 
     linter: QueryStringLinter
 
@@ -156,12 +157,15 @@ class QueryStringParser(ABC):
         # This is not a problem for the parser, but for the linter
         # which expects whitespace between operators and search terms
 
-        i = 0
-        while i < len(self.tokens) - 1:
-            token = self.tokens[i]
-            next_token = self.tokens[i + 1]
+        if not self.tokens:
+            return
+
+        # Build the new token list in one pass (instead of inserting in place)
+        tokens: typing.List[Token] = []
+        for token, next_token in zip(self.tokens, self.tokens[1:]):
+            tokens.append(token)
 
-            appended_operator_match = re.search(r"(AND|OR|NOT)$", token.value)
+            appended_operator_match = self.APPENDED_OPERATOR_REGEX.search(token.value)
 
             # if the end of a search term (value) is a capitalized operator
             # without a whitespace, split the tokens
@@ -178,20 +182,20 @@ class QueryStringParser(ABC):
                     token.position[0],
                     token.position[1] - len(appended_operator),
                 )
-                # insert operator token afterwards
-                operator_token = Token(
-                    value=appended_operator,
-                    type=TokenTypes.LOGIC_OPERATOR,
-                    position=(
-                        token.position[1],
-                        token.position[1] + len(appended_operator),
-                    ),
+                # add operator token afterwards
+                tokens.append(
+                    Token(
+                        value=appended_operator,
+                        type=TokenTypes.LOGIC_OPERATOR,
+                        position=(
+                            token.position[1],
+                            token.position[1] + len(appended_operator),
+                        ),
+                    )
                 )
-                self.tokens.insert(i + 1, operator_token)
 
-                i += 2  # Skip over the newly inserted operator token
-            else:
-                i += 1
+        tokens.append(self.tokens[-1])
+        self.tokens = tokens
 
     @abstractmethod
     def parse(self) -> Query:
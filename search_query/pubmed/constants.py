@@ -5,6 +5,7 @@ import re
 import typing
 from copy import deepcopy
 
+from search_query.constants import build_reverse_field_map
 from search_query.constants import Fields
 
 # fields from https://pubmed.ncbi.nlm.nih.gov/help/
@@ -25,6 +26,8 @@ SYNTAX_GENERIC_MAP = {
     "[dp]": {Fields.YEAR_PUBLICATION},
 }
 
+_GENERIC_SYNTAX_MAP = build_reverse_field_map(SYNTAX_GENERIC_MAP)
+
 YEAR_PUBLISHED_FIELD_REGEX: re.Pattern = re.compile(
     r"\[dp\]|\[publication date\]|\[pdat\]", re.IGNORECASE
 )
@@ -120,9 +123,8 @@ def syntax_str_to_generic_field_set(field_value: str) -> set:
     field_value = map_to_standard(field_value)
 
     # Convert search fields to default field constants
-    for key, value in SYNTAX_GENERIC_MAP.items():
-        if field_value == key:
-            return deepcopy(value)
+    if field_value in SYNTAX_GENERIC_MAP:
+        return deepcopy(SYNTAX_GENERIC_MAP[field_value])
 
     raise ValueError(f"Field {field_value} not supported by PubMed")  # pragma: no cover
 
@@ -130,13 +132,8 @@ def syntax_str_to_generic_field_set(field_value: str) -> set:
 def generic_field_to_syntax_field(generic_field: str) -> str:
     """Convert a set of generic search fields to a set of syntax strings."""
 
-    for key, value in SYNTAX_GENERIC_MAP.items():
-        if {generic_field} == value:
-            return key
-
-    for key, value in SYNTAX_GENERIC_MAP.items():
-        if {generic_field} & value:
-            return key
+    if generic_field in _GENERIC_SYNTAX_MAP:
+        return _GENERIC_SYNTAX_MAP[generic_field]
 
     raise ValueError(  # pragma: no cover
         f"Generic search field set {generic_field} " "not supported by Pubmed"
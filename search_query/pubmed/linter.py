@@ -20,41 +20,41 @@ from search_query.query import Query
 
 if typing.TYPE_CHECKING:  # pragma: no cover
     from search_query.pubmed.parser import PubmedListParser
-    from search_query.parser_base import QueryStringParser
 
 
 class PubmedQueryStringLinter(QueryStringLinter):
     """Linter for PubMed Query Strings"""
 
     PROXIMITY_REGEX = re.compile(r"^\[(.+):~(.*)\]$")
+    INVALID_FIELD_SYNTAX_REGEX = re.compile(r"\b[A-Z]{2}=")
     PLATFORM: PLATFORM = PLATFORM.PUBMED
 
-    VALID_TOKEN_SEQUENCES: typing.Dict[TokenTypes, typing.List[TokenTypes]] = {
-        TokenTypes.PARENTHESIS_OPEN: [
+    VALID_TOKEN_SEQUENCES: typing.Dict[TokenTypes, typing.Set[TokenTypes]] = {
+        TokenTypes.PARENTHESIS_OPEN: {
             TokenTypes.TERM,
             TokenTypes.PARENTHESIS_OPEN,
-        ],
-        TokenTypes.PARENTHESIS_CLOSED: [
+        },
+        TokenTypes.PARENTHESIS_CLOSED: {
             TokenTypes.LOGIC_OPERATOR,
             TokenTypes.PARENTHESIS_CLOSED,
-        ],
-        TokenTypes.TERM: [
+        },
+        TokenTypes.TERM: {
             TokenTypes.FIELD,
             TokenTypes.LOGIC_OPERATOR,
             TokenTypes.PARENTHESIS_CLOSED,
-        ],
-        TokenTypes.FIELD: [
+        },
+        TokenTypes.FIELD: {
             TokenTypes.LOGIC_OPERATOR,
             TokenTypes.PARENTHESIS_CLOSED,
             TokenTypes.RANGE_OPERATOR,
-        ],
-        TokenTypes.LOGIC_OPERATOR: [
+        },
+        TokenTypes.LOGIC_OPERATOR: {
             TokenTypes.TERM,
             TokenTypes.PARENTHESIS_OPEN,
-        ],
-        TokenTypes.RANGE_OPERATOR: [
+        },
+        TokenTypes.RANGE_OPERATOR: {
             TokenTypes.TERM,
-        ],
+        },
     }
 
     YEAR_VALUE_REGEX = re.compile(
@@ -115,7 +115,7 @@ class PubmedQueryStringLinter(QueryStringLinter):
         """Check for invalid syntax in the query string."""
 
         # Check for erroneous field syntax
-        match = re.search(r"\b[A-Z]{2}=", self.query_str)
+        match = self.INVALID_FIELD_SYNTAX_REGEX.search(self.query_str)
         if match:
             self.add_message(
                 QueryErrorCode.INVALID_SYNTAX,
@@ -173,10 +173,8 @@ class PubmedQueryStringLinter(QueryStringLinter):
 
         # pylint: disable=duplicate-code
         # Check following token sequences
-        for i, token in enumerate(self.tokens):
-            if i == 0:
-                continue
-
+        for i in range(1, len(self.tokens)):
+            token = self.tokens[i]
             token_type = token.type
             prev_type = self.tokens[i - 1].type
 
@@ -586,16 +584,9 @@ class PubmedQueryStringLinter(QueryStringLinter):
 class PubmedQueryListLinter(QueryListLinter):
     """Linter for PubMed Query Strings"""
 
-    OPERATOR_NODE_REGEX = re.compile(r"#?\d+|AND|OR|NOT")
+    parser: PubmedListParser
 
-    def __init__(
-        self,
-        parser: PubmedListParser,
-        string_parser_class: typing.Type[QueryStringParser],
-    ):
-        self.parser: PubmedListParser = parser
-        self.string_parser_class = string_parser_class
-        super().__init__(parser, string_parser_class)
+    OPERATOR_NODE_REGEX = re.compile(r"#?\d+|AND|OR|NOT")
 
     def validate_tokens(self) -> None:
         """Validate token list"""
@@ -27,6 +27,7 @@ class PubmedParser(QueryStringParser):
     SEARCH_PHRASE_REGEX = re.compile(r"\".*?\"")
     TERM_REGEX = re.compile(r"[^\s\[\]()\|&]+")
     PROXIMITY_REGEX = re.compile(r"^\[(.+):~(.*)\]$")
+    PREFIX_REGEX = re.compile(r"^Pubmed.*\:\s*", flags=re.IGNORECASE)
 
     pattern = re.compile(
         "|".join(
@@ -255,9 +256,7 @@ class PubmedParser(QueryStringParser):
         self.linter.handle_fully_quoted_query_str(self)
 
         self.linter.handle_nonstandard_quotes_in_query_str(self)
-        self.linter.handle_prefix_in_query_str(
-            self, prefix_regex=re.compile(r"^Pubmed.*\:\s*", flags=re.IGNORECASE)
-        )
+        self.linter.handle_prefix_in_query_str(self, prefix_regex=self.PREFIX_REGEX)
         self.linter.handle_suffix_in_query_str(self)
 
     def parse(self) -> Query:
@@ -10,42 +10,52 @@ if typing.TYPE_CHECKING:  # pragma: no cover
     from search_query.query import Query
 
 
-def to_string_pubmed(query: Query) -> str:
-    """Serialize the Query tree into a PubMed search string."""
+def _append_pubmed(query: Query, parts: typing.List[str]) -> None:
+    """Append the PubMed string of the query (and its children) to parts."""
     if not query.children:
         # Serialize term query
-        return f"{query.value}" f"{query.field.value if query.field else ''}"
+        parts.append(f"{query.value}" f"{query.field.value if query.field else ''}")
+        return
     if query.value == Operators.NEAR:
         # Serialize near query
         distance = query.distance if hasattr(query, "distance") else 0
         assert query.children[0].field
-        return (
+        parts.append(
             f"{query.children[0].value}"
             f"{query.children[0].field.value[:-1]}"
             f":~{distance}]"
         )
+        return
     if query.value == Operators.RANGE:
         # Serialize range query
         assert query.children[0].field
         assert query.children[1]
-        return (
+        parts.append(
             f"{query.children[0].value}:{query.children[1].value}"
             f"{query.children[0].field.value}"
         )
+        return
+
     # Serialize compound query
-    result = ""
+    nested = bool(query.get_parent())
+    if nested:
+        # Add parentheses around nested queries
+        parts.append("(")
     for i, child in enumerate(query.children):
         if i > 0:
             # Add operator between query children
-            result += f" {query.value} "
+            parts.append(f" {query.value} ")
         if isinstance(child, str):
-            result += child
+            parts.append(child)
         else:
             # Recursively serialize query children
-            result += to_string_pubmed(child)
+            _append_pubmed(child, parts)
+    if nested:
+        parts.append(")")
 
-    if query.get_parent():
-        # Add parentheses around nested queries
-        result = "(" + result + ")"
 
-    return result
+def to_string_pubmed(query: Query) -> str:
+    """Serialize the Query tree into a PubMed search string."""
+    parts: typing.List[str] = []
+    _append_pubmed(query, parts)
+    return "".join(parts)
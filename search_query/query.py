@@ -21,13 +21,25 @@ from search_query.wos.serializer import to_string_wos
 class Query:
     """Query class."""
 
+    VALID_OPERATORS = frozenset(
+        {
+            Operators.AND,
+            Operators.OR,
+            Operators.NOT,
+            Operators.NEAR,
+            Operators.WITHIN,
+            Operators.RANGE,
+        }
+    )
+    VALID_PLATFORMS = frozenset([p.value for p in PLATFORM] + ["deactivated"])
+
     # pylint: disable=too-many-arguments
     def __init__(
         self,
         value: str,
         *,
         operator: bool = True,
-        field: typing.Optional[SearchField] = None,
+        field: typing.Optional[typing.Union[SearchField, str]] = None,
         children: typing.Optional[typing.List[typing.Union[str, Query]]] = None,
         position: typing.Optional[typing.Tuple[int, int]] = None,
         platform: str = "generic",
@@ -48,7 +60,6 @@ class Query:
         else:
             self.field = field
         self.position = position
-        self.marked = False
         # Note: platform is only set for root nodes
         self._platform = platform
         # helper flag to silence linter after parse() to avoid repeated linter printout
@@ -56,8 +67,7 @@ class Query:
 
         self._parent: typing.Optional[Query] = None
         if children:
-            for child in children:
-                self.add_child(child)
+            self._children.extend(self._adopt_child(child) for child in children)
 
         self._set_platform_recursively(platform)
 
@@ -183,7 +193,7 @@ class Query:
     @platform.setter
     def platform(self, platform: str) -> None:
         """Set the platform property."""
-        if platform not in [p.value for p in PLATFORM] + ["deactivated"]:
+        if platform not in self.VALID_PLATFORMS:
             raise ValueError(f"Invalid platform: {platform}")
         self._set_platform_recursively(platform)
         self._validate_platform_constraints()
@@ -237,14 +247,7 @@ class Query:
         if self.operator:
             if self._value:
                 raise AttributeError("operator value can only be set once")
-            if v not in [
-                Operators.AND,
-                Operators.OR,
-                Operators.NOT,
-                Operators.NEAR,
-                Operators.WITHIN,
-                Operators.RANGE,
-            ]:
+            if v not in self.VALID_OPERATORS:
                 raise ValueError(f"Invalid operator value: {v}")
         self._value = v
 
@@ -278,12 +281,17 @@ class Query:
         # Note: OrQuery, AndQuery, NearQuery, NotQuery, RANGEQuery offeride the setter
         # with specific validation.
 
-        # Add each new child using add_child (ensures parent is set)
-        for child in children or []:
-            self.add_child(child)
+        # Add the new children (_adopt_child ensures parent is set)
+        self._children.extend(self._adopt_child(child) for child in children or [])
 
     def add_child(self, child: typing.Union[str, Query]) -> Query:
         """Add a child Query node and set its parent pointer."""
+        child = self._adopt_child(child)
+        self._children.append(child)
+        return child
+
+    def _adopt_child(self, child: typing.Union[str, Query]) -> Query:
+        """Convert a child (str or Query) to a Query node and set its parent."""
         if isinstance(child, str):
             # pylint: disable=import-outside-toplevel
             from search_query.query_term import Term
@@ -296,7 +304,6 @@ class Query:
         if not isinstance(child, Query):
             raise TypeError("Child must be a Query instance or a string")
         child._set_parent(self)  # pylint: disable=protected-access
-        self._children.append(child)
         return child
 
     def _set_parent(self, parent: typing.Optional[Query]) -> None:
@@ -431,28 +438,17 @@ class Query:
     def _ensure_children_not_circular(
         self,
     ) -> None:
-        """parse the query provided, build nodes&tree structure"""
-
-        # Mark nodes to prevent circular references
-        self._mark()
-        # Remove marks
-        self._remove_marks()
-
-    def _mark(self) -> None:
-        """marks the node"""
-        if self.marked:
-            raise ValueError("Building Query Tree failed")
-        self.marked = True
-        for child in self.children:
-            # pylint: disable=protected-access
-            child._mark()
-
-    def _remove_marks(self) -> None:
-        """removes the mark from the node"""
-        self.marked = False
-        for child in self.children:
-            # pylint: disable=protected-access
-            child._remove_marks()
+        """Ensure that no node is contained more than once in the query tree"""
+
+        # Iterative traversal, tracking visited nodes by id
+        visited: typing.Set[int] = set()
+        stack: typing.List[Query] = [self]
+        while stack:
+            node = stack.pop()
+            if id(node) in visited:
+                raise ValueError("Building Query Tree failed")
+            visited.add(id(node))
+            stack.extend(node.children)
 
     def to_structured_string(self) -> str:
         """Prints the query in generic syntax"""
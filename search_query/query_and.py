@@ -29,11 +29,7 @@ class AndQuery(Query):
         super().__init__(
             value=Operators.AND,
             children=children,
-            field=field
-            if isinstance(field, SearchField)
-            else SearchField(field)
-            if field is not None
-            else None,
+            field=field,
             position=position,
             platform=platform,
         )
@@ -54,9 +50,8 @@ class AndQuery(Query):
         if len(children) < 2:
             raise ValueError("An AND query must have two children")
 
-        # Add each new child using add_child (ensures parent is set)
-        for child in children or []:
-            self.add_child(child)
+        # Add the new children (_adopt_child ensures parent is set)
+        self._children.extend(self._adopt_child(child) for child in children or [])
 
     def selects_record(self, record_dict: dict) -> bool:
         return all(x.selects(record_dict=record_dict) for x in self.children)
@@ -41,11 +41,7 @@ class NEARQuery(Query):
         super().__init__(
             value=value,
             children=cast(List[Union[str, Query]], query_children),
-            field=field
-            if isinstance(field, SearchField)
-            else SearchField(field)
-            if field is not None
-            else None,
+            field=field,
             position=position,
             platform=platform,
         )
@@ -95,9 +91,8 @@ class NEARQuery(Query):
             if len(children) != 2:
                 raise ValueError("A NEAR query must have two children")
 
-        # Add each new child using add_child (ensures parent is set)
-        for child in children or []:
-            self.add_child(child)
+        # Add the new children (_adopt_child ensures parent is set)
+        self._children.extend(self._adopt_child(child) for child in children or [])
 
     def selects_record(self, record_dict: dict) -> bool:
         """Check if the record matches the NEAR query."""
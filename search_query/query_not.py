@@ -40,11 +40,7 @@ class NotQuery(Query):
         super().__init__(
             value=Operators.NOT,
             children=cast(List[Union[str, Query]], query_children),
-            field=field
-            if isinstance(field, SearchField)
-            else SearchField(field)
-            if field is not None
-            else None,
+            field=field,
             position=position,
             platform=platform,
         )
@@ -67,9 +63,8 @@ class NotQuery(Query):
         if self.platform not in {"deactivated", PLATFORM.WOS} and len(children) != 2:
             raise ValueError("A NOT query must have two children")
 
-        # Add each new child using add_child (ensures parent is set)
-        for child in children or []:
-            self.add_child(child)
+        # Add the new children (_adopt_child ensures parent is set)
+        self._children.extend(self._adopt_child(child) for child in children or [])
 
     def selects_record(self, record_dict: dict) -> bool:
         return self.children[0].selects(record_dict=record_dict) and not self.children[
@@ -13,6 +13,9 @@ from typing import Optional
 class SearchFile:
     """SearchFile class."""
 
+    ORCID_REGEX = re.compile(r"^\d{4}-\d{4}-\d{4}-\d{3}[0-9X]$")
+    EMAIL_REGEX = re.compile(r"^\S+@\S+\.\S+$")
+
     # pylint: disable=too-many-arguments
     # pylint: disable=too-many-positional-arguments
     def __init__(
@@ -80,13 +83,13 @@ class SearchFile:
             if "ORCID" in author:
                 if not isinstance(author["ORCID"], str):
                     raise TypeError("ORCID must be a string.")
-                if not re.match(r"^\d{4}-\d{4}-\d{4}-\d{3}[0-9X]$", author["ORCID"]):
+                if not self.ORCID_REGEX.match(author["ORCID"]):
                     raise ValueError("Invalid ORCID.")
 
             if "email" in author:
                 if not isinstance(author["email"], str):
                     raise TypeError("Email must be a string.")
-                if not re.match(r"^\S+@\S+\.\S+$", author["email"]):
+                if not self.EMAIL_REGEX.match(author["email"]):
                     raise ValueError("Invalid email.")
 
 
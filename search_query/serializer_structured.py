@@ -22,14 +22,14 @@ def _reindent(input_str: str, num_spaces: int) -> str:
     return "\n".join(lines)
 
 
-def to_string_structured(query: Query, *, level: int = 0) -> str:
-    """Convert the query to a string."""
+def _append_structured(query: Query, level: int, parts: typing.List[str]) -> None:
+    """Append the structured string of the query (and its children) to parts."""
 
     indent = "   "
-    result = ""
 
     if not hasattr(query, "value"):  # pragma: no cover
-        return f"{indent} (?)"
+        parts.append(f"{indent} (?)")
+        return
 
     field = ""
     if query.field:
@@ -38,17 +38,26 @@ def to_string_structured(query: Query, *, level: int = 0) -> str:
     query_value = query.value
     if hasattr(query, "distance"):  # and isinstance(query.distance, int):
         query_value += f"/{query.distance}"
-    result = _reindent(f"{query_value} {field}", level)
+    parts.append(_reindent(f"{query_value} {field}", level))
 
     if query.children == []:
-        return result
+        return
 
-    result = f"{result}[\n"
+    parts.append("[\n")
     for child in query.children:
-        result = f"{result}{to_string_structured(child, level=level + 1)}\n"
-    result = f"{result}{'|' + ' ' * level * 3 + ' '}]"
+        _append_structured(child, level + 1, parts)
+        parts.append("\n")
+    parts.append(f"{'|' + ' ' * level * 3 + ' '}]")
+
+
+def to_string_structured(query: Query, *, level: int = 0) -> str:
+    """Convert the query to a string."""
 
-    return result
+    # Collect the parts in a single list and join once (instead of
+    # rebuilding the (growing) result string for every child)
+    parts: typing.List[str] = []
+    _append_structured(query, level, parts)
+    return "".join(parts)
 
 
 def to_string_structured_2(query: Query, level: int = 0) -> str:
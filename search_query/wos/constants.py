@@ -3,6 +3,7 @@
 import re
 from copy import deepcopy
 
+from search_query.constants import build_reverse_field_map
 from search_query.constants import Fields
 
 # https://webofscience.help.clarivate.com/en-us/Content/wos-core-collection/woscc-field-tags.htm
@@ -49,6 +50,8 @@ SYNTAX_GENERIC_MAP = {
     "ZP=": {Fields.ZIP_POSTAL_CODE},
 }
 
+_GENERIC_SYNTAX_MAP = build_reverse_field_map(SYNTAX_GENERIC_MAP)
+
 
 # Variants of syntax strings to normalize to standard WOS fields
 # Note: instead of lising capitlized options, use re.IGNORECASE in matching
@@ -118,9 +121,8 @@ def syntax_str_to_generic_field_set(field_value: str) -> set:
     """Translate a search field string to a generic set of Fields."""
     field_value = field_value.strip().lower()
     field_value = map_to_standard(field_value.upper())
-    for key, value in SYNTAX_GENERIC_MAP.items():
-        if field_value.upper() == key:
-            return deepcopy(value)
+    if field_value.upper() in SYNTAX_GENERIC_MAP:
+        return deepcopy(SYNTAX_GENERIC_MAP[field_value.upper()])
     raise ValueError(
         f"Field {field_value} not supported by Web of Science"
     )  # pragma: no cover
@@ -129,13 +131,8 @@ def syntax_str_to_generic_field_set(field_value: str) -> set:
 def generic_field_to_syntax_field(generic_field: str) -> str:
     """Convert a set of generic search fields to a set of syntax strings."""
 
-    for key, value in SYNTAX_GENERIC_MAP.items():
-        if {generic_field} == value:
-            return key
-
-    for key, value in SYNTAX_GENERIC_MAP.items():
-        if {generic_field} & value:
-            return key
+    if generic_field in _GENERIC_SYNTAX_MAP:
+        return _GENERIC_SYNTAX_MAP[generic_field]
 
     raise ValueError(  # pragma: no cover
         f"Generic search field set {generic_field} " "not supported by WOS"
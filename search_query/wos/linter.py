@@ -29,6 +29,8 @@ class WOSQueryStringLinter(QueryStringLinter):
     )
     DOI_VALUE_REGEX = re.compile(r"^10\.\d{4,9}/[-._;()/:A-Z0-9]+$", re.IGNORECASE)
     YEAR_VALUE_REGEX = re.compile(r"^\d{4}(-\d{4})?$")
+    INVALID_FIELD_SYNTAX_REGEX = re.compile(r"\[[A-Za-z]*\]")
+    UNSUPPORTED_WILDCARD_REGEX = re.compile(r"\!+")
 
     WILDCARD_CHARS = ["?", "$", "*"]
 
@@ -37,36 +39,36 @@ class WOSQueryStringLinter(QueryStringLinter):
     PLATFORM: PLATFORM = PLATFORM.WOS
 
     VALID_TOKEN_SEQUENCES = {
-        TokenTypes.FIELD: [
+        TokenTypes.FIELD: {
             TokenTypes.TERM,
             TokenTypes.PARENTHESIS_OPEN,
-        ],
-        TokenTypes.TERM: [
+        },
+        TokenTypes.TERM: {
             TokenTypes.TERM,
             TokenTypes.LOGIC_OPERATOR,
             TokenTypes.PROXIMITY_OPERATOR,
             TokenTypes.PARENTHESIS_CLOSED,
-        ],
-        TokenTypes.LOGIC_OPERATOR: [
+        },
+        TokenTypes.LOGIC_OPERATOR: {
             TokenTypes.TERM,
             TokenTypes.FIELD,
             TokenTypes.PARENTHESIS_OPEN,
-        ],
-        TokenTypes.PROXIMITY_OPERATOR: [
+        },
+        TokenTypes.PROXIMITY_OPERATOR: {
             TokenTypes.TERM,
             TokenTypes.PARENTHESIS_OPEN,
             TokenTypes.FIELD,
-        ],
-        TokenTypes.PARENTHESIS_OPEN: [
+        },
+        TokenTypes.PARENTHESIS_OPEN: {
             TokenTypes.FIELD,
             TokenTypes.TERM,
             TokenTypes.PARENTHESIS_OPEN,
-        ],
-        TokenTypes.PARENTHESIS_CLOSED: [
+        },
+        TokenTypes.PARENTHESIS_CLOSED: {
             TokenTypes.PARENTHESIS_CLOSED,
             TokenTypes.LOGIC_OPERATOR,
             TokenTypes.PROXIMITY_OPERATOR,
-        ],
+        },
     }
 
     def __init__(
@@ -118,7 +120,7 @@ class WOSQueryStringLinter(QueryStringLinter):
         """Check for invalid syntax in the query string."""
 
         # Check for erroneous field syntax
-        match = re.search(r"\[[A-Za-z]*\]", self.query_str)
+        match = self.INVALID_FIELD_SYNTAX_REGEX.search(self.query_str)
         if match:
             self.add_message(
                 QueryErrorCode.INVALID_SYNTAX,
@@ -298,7 +300,7 @@ class WOSQueryStringLinter(QueryStringLinter):
                 continue
 
             # Check transition
-            allowed_next_types = self.VALID_TOKEN_SEQUENCES.get(token.type, [])
+            allowed_next_types = self.VALID_TOKEN_SEQUENCES.get(token.type, set())
             if next_token.type not in allowed_next_types:
                 self.add_message(
                     QueryErrorCode.INVALID_TOKEN_SEQUENCE,
@@ -324,7 +326,7 @@ class WOSQueryStringLinter(QueryStringLinter):
 
         if query.is_term():
             # Web of Science does not support "!"
-            for match in re.finditer(r"\!+", query.value):
+            for match in self.UNSUPPORTED_WILDCARD_REGEX.finditer(query.value):
                 position = (-1, -1)
                 if query.position:
                     position = (
@@ -524,7 +526,6 @@ class WOSQueryListLinter(QueryListLinter):
             string_parser_class=string_parser_class,
             original_query_str=original_query_str,
         )
-        self.messages: dict = {}
 
     def validate_list_tokens(self) -> None:
         """Lint the list parser."""
@@ -36,6 +36,8 @@ class WOSParser(QueryStringParser):
     FIELD_REGEX = re.compile(r"\b\w{2}=|\b\w{3}=")
     PARENTHESIS_REGEX = re.compile(r"[\(\)]")
     fieldS_REGEX = re.compile(r"\b(?!and\b)[a-zA-Z]+(?:\s(?!and\b)[a-zA-Z]+)*")
+    PROXIMITY_DISTANCE_REGEX = re.compile(r"/(\d+)")
+    PREFIX_REGEX = re.compile(r"^Web of Science\:?\s*", flags=re.IGNORECASE)
 
     OPERATOR_REGEX = re.compile(
         "|".join([LOGIC_OPERATOR_REGEX.pattern, PROXIMITY_OPERATOR_REGEX.pattern])
@@ -331,7 +333,7 @@ class WOSParser(QueryStringParser):
 
     def _extract_proximity_distance(self, token: Token) -> int:
         """Extract distance from proximity operator like NEAR/5 or WITHIN/3"""
-        match = re.search(r"/(\d+)", token.value)
+        match = self.PROXIMITY_DISTANCE_REGEX.search(token.value)
         if not match:
             raise ValueError(f"Invalid proximity operator: {token.value}")
         return int(match.group(1))
@@ -339,9 +341,7 @@ class WOSParser(QueryStringParser):
     def _pre_tokenization_checks(self) -> None:
         self.linter.handle_fully_quoted_query_str(self)
         self.linter.handle_nonstandard_quotes_in_query_str(self)
-        self.linter.handle_prefix_in_query_str(
-            self, prefix_regex=re.compile(r"^Web of Science\:?\s*", flags=re.IGNORECASE)
-        )
+        self.linter.handle_prefix_in_query_str(self, prefix_regex=self.PREFIX_REGEX)
         self.linter.handle_suffix_in_query_str(self)
 
     def parse(self) -> Query:
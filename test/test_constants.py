@@ -1,7 +1,14 @@
 #!/usr/bin/env python
 """Tests for the constants"""
+import typing
 from collections import Counter
 
+import pytest
+
+import search_query.ebsco.constants as ebsco_constants
+import search_query.pubmed.constants as pubmed_constants
+import search_query.wos.constants as wos_constants
+from search_query.constants import Fields
 from search_query.constants import QueryErrorCode
 
 # pylint: disable=line-too-long
@@ -50,3 +57,24 @@ def test_assert_error_codes_not_none() -> None:
     codes = [e.code for e in QueryErrorCode]
 
     assert all(code is not None for code in codes), "Error codes should not be None"
+
+
+@pytest.mark.parametrize(
+    "generic_field_to_syntax_field, generic_field, expected",
+    [
+        # exact matches take precedence over combined fields ([tiab], TS=)
+        (pubmed_constants.generic_field_to_syntax_field, Fields.TITLE, "[ti]"),
+        (pubmed_constants.generic_field_to_syntax_field, Fields.ABSTRACT, "[tiab]"),
+        (wos_constants.generic_field_to_syntax_field, Fields.TITLE, "TI="),
+        (wos_constants.generic_field_to_syntax_field, Fields.KEYWORDS_PLUS, "KP="),
+        # first matching key wins
+        (ebsco_constants.generic_field_to_syntax_field, Fields.SUBJECT_TERMS, "SU"),
+        (ebsco_constants.generic_field_to_syntax_field, Fields.KEYWORDS, "KW"),
+    ],
+)
+def test_generic_field_to_syntax_field(
+    generic_field_to_syntax_field: typing.Callable[[str], str],
+    generic_field: str,
+    expected: str,
+) -> None:
+    assert generic_field_to_syntax_field(generic_field) == expected
@@ -5,6 +5,7 @@ from search_query.constants import QueryErrorCode
 from search_query.constants import Token
 from search_query.constants import TokenTypes
 from search_query.linter_base import QueryStringLinter
+from search_query.pubmed.parser import PubmedParser
 from search_query.query_and import AndQuery
 from search_query.query_term import Term
 
@@ -177,3 +178,29 @@ def test_check_invalid_characters_in_term_query() -> None:
             "details": "Invalid character '#' in search term 'digitalizat#ion'",
         }
     ]
+
+
+def test_handle_fully_quoted_query_str() -> None:
+    query_str = '"(digital OR virtual) AND work"'
+    parser = PubmedParser(query_str)
+    parser.linter.handle_fully_quoted_query_str(parser)
+    assert parser.query_str == "(digital OR virtual) AND work"
+    assert [m["code"] for m in parser.linter.messages] == ["PARSE_0007"]
+
+    # Quoted terms at the start/end: the query itself is not in quotes
+    for query_str in ['"digital" AND (work OR labor) AND "office"', '"a" AND "b"']:
+        parser = PubmedParser(query_str)
+        parser.linter.handle_fully_quoted_query_str(parser)
+        assert parser.query_str == query_str
+        assert parser.linter.messages == []
+
+
+def test_add_message_deduplicates() -> None:
+    linter = QueryStringLinter("digitalization AND work")  # type: ignore
+    linter.add_message(QueryErrorCode.TOKENIZING_FAILED, positions=[(0, 14)])
+    linter.add_message(QueryErrorCode.TOKENIZING_FAILED, positions=[(0, 14)])
+    linter.add_message(QueryErrorCode.TOKENIZING_FAILED, positions=[(19, 23)])
+    assert [msg["position"] for msg in linter.messages] == [[(0, 14)], [(19, 23)]]
+
+    other_linter = QueryStringLinter("digitalization AND work")  # type: ignore
+    assert other_linter.messages == []
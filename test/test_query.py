@@ -25,6 +25,12 @@ def test_invalid_tree_structure(query_setup: dict) -> None:
             field=SearchField(Fields.TITLE),
         )
 
+    # A failed check must not leave the nodes in an unusable state
+    AndQuery(
+        ["valid", query_setup["query_ai"]],
+        field=SearchField(Fields.TITLE),
+    )
+
 
 def test_selects(query_setup: dict) -> None:
     query_ai = query_setup["query_ai"]
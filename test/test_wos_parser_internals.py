@@ -114,6 +114,36 @@ def test_combine_subsequent_terms_with_mixed_case() -> None:
     assert parser.tokens == expected_tokens
 
 
+def test_split_operators_with_missing_whitespace() -> None:
+    """
+    Test the `split_operators_with_missing_whitespace` method.
+
+    This test verifies that capitalized operators appended to a search term
+    are split into separate operator tokens.
+    """
+    parser = WOSParser(query_str="")
+    parser.tokens = [
+        Token(value="digitalAND", type=TokenTypes.TERM, position=(0, 10)),
+        Token(value="(", type=TokenTypes.PARENTHESIS_OPEN, position=(11, 12)),
+        Token(value="workOR", type=TokenTypes.TERM, position=(12, 18)),
+        Token(value="health", type=TokenTypes.TERM, position=(19, 25)),
+        Token(value=")", type=TokenTypes.PARENTHESIS_CLOSED, position=(25, 26)),
+    ]
+    parser.split_operators_with_missing_whitespace()
+
+    expected_tokens = [
+        Token(value="digital", type=TokenTypes.TERM, position=(0, 7)),
+        Token(value="AND", type=TokenTypes.LOGIC_OPERATOR, position=(7, 10)),
+        Token(value="(", type=TokenTypes.PARENTHESIS_OPEN, position=(11, 12)),
+        Token(value="work", type=TokenTypes.TERM, position=(12, 16)),
+        Token(value="OR", type=TokenTypes.LOGIC_OPERATOR, position=(16, 18)),
+        Token(value="health", type=TokenTypes.TERM, position=(19, 25)),
+        Token(value=")", type=TokenTypes.PARENTHESIS_CLOSED, position=(25, 26)),
+    ]
+
+    assert parser.tokens == expected_tokens
+
+
 def test_check_fields_title() -> None:
     """
     Test the `check_fields` method with title search fields.